@@ -3,8 +3,11 @@ Script to generate all witch voice audio files using ElevenLabs.
 """
 
 import asyncio
+import os
 from pathlib import Path
+from elevenlabs.core.api_error import ApiError
 from src.services.tts_service import tts_service
+from src.workflows.doorbell_flow import THINKING_TEXT
 
 
 async def generate_all_audio():
@@ -18,6 +21,7 @@ async def generate_all_audio():
         "witch_access_denied": "Zugang verweigert!",
         "witch_no_audio": "Ich habe dich nicht verstanden. Bitte wiederhole!",
         "witch_error": "System-Fehler. Bitte normal klingeln.",
+        "witch_thinking": THINKING_TEXT,
     }
 
     print("🧙‍♀️ Generating witch voice audio files with ElevenLabs...\n")
@@ -25,27 +29,42 @@ async def generate_all_audio():
     audio_dir = Path("audio_assets")
     audio_dir.mkdir(exist_ok=True)
 
-    for filename, text in phrases.items():
-        output_path = audio_dir / f"{filename}.mp3"
+    # Dispatch all phrases at once; each call is network-bound, so the total
+    # wall time is the slowest request instead of the sum of all of them.
+    try:
+        results = await tts_service.generate_many(
+            {str(audio_dir / f"{filename}.mp3"): text for filename, text in phrases.items()}
+        )
+    finally:
+        tts_service.close()
 
+    for (filename, text), result in zip(phrases.items(), results):
         print(f"📝 Generating: {filename}")
         print(f"   Text: {text}")
 
-        try:
-            result = await tts_service.generate_audio(
-                text=text,
-                output_path=str(output_path)
-            )
-            print(f"   ✅ Saved to: {result}\n")
-        except Exception as e:
-            print(f"   ❌ Error: {e}\n")
+        if isinstance(result, asyncio.CancelledError):
+            print("   ⏭️  Skipped: credit limit reached\n")
             continue
+        if isinstance(result, ApiError):
+            print(f"   ❌ API error ({result.status_code}): {result.body}\n")
+            continue
+        if isinstance(result, Exception):
+            print(f"   ❌ Error: {result}\n")
+            continue
+
+        print(f"   ✅ Saved to: {result}\n")
 
     print("🎉 All audio files generated!")
     print(f"\nGenerated files in {audio_dir}:")
-    for file in sorted(audio_dir.glob("*.mp3")):
-        size_kb = file.stat().st_size / 1024
-        print(f"  - {file.name} ({size_kb:.1f} KB)")
+    # One directory read; DirEntry carries the stat info on most platforms
+    with os.scandir(audio_dir) as it:
+        entries = sorted(
+            (e for e in it if e.is_file() and e.name.endswith(".mp3")),
+            key=lambda e: e.name,
+        )
+    for entry in entries:
+        size_kb = entry.stat().st_size / 1024
+        print(f"  - {entry.name} ({size_kb:.1f} KB)")
 
 
 if __name__ == "__main__":
@@ -5,65 +5,52 @@ Optimized for limited credits.
 
 import asyncio
 from pathlib import Path
-from elevenlabs.client import ElevenLabs
-from src.config import settings
+from src.services.rate_limit import is_quota_error
+from src.services.tts_service import TTSService
+from src.workflows.doorbell_flow import PROMPT_TEXTS
 
 
 async def generate_audio_files():
     """Generate shortened audio files for the witch voice system."""
 
-    client = ElevenLabs(api_key=settings.elevenlabs_api_key)
+    # TTSService reuses one keep-alive HTTP/2 connection for every request
     voice_id = "21m00Tcm4TlvDq8ikWAM"  # Rachel voice
+    tts = TTSService(voice_id=voice_id)
 
-    # Shortened phrases to save credits
-    phrases = {
-        "witch_password": "Passwort?",
-        "witch_welcome": "Willkommen!",
-        "witch_wrong": "Falsch!",
-        "witch_denied": "Verweigert!",
-        "witch_repeat": "Wiederholen!",
-    }
+    # Shortened phrases to save credits; the same prompts the server warms
+    # up at startup, so both produce identical audio and cache entries
+    phrases = PROMPT_TEXTS
 
     print("🧙‍♀️ Generating witch voice audio files...\n")
 
-    audio_dir = Path("audio_assets")
-    audio_dir.mkdir(exist_ok=True)
-
     success_count = 0
     failed_count = 0
+    quota_exceeded = False
 
-    for filename, text in phrases.items():
-        output_path = audio_dir / f"{filename}.mp3"
-
-        print(f"📝 {filename}: '{text}'")
+    try:
+        results = await tts.generate_many(phrases)
+    finally:
+        tts.close()
 
-        try:
-            # Generate audio
-            audio_generator = client.text_to_speech.convert(
-                voice_id=voice_id,
-                text=text,
-                model_id="eleven_multilingual_v2",
-            )
+    for (output_path, text), result in zip(phrases.items(), results):
+        print(f"📝 {Path(output_path).stem}: '{text}'")
 
-            # Save to file
-            with open(output_path, "wb") as f:
-                for chunk in audio_generator:
-                    if chunk:
-                        f.write(chunk)
-
-            file_size = output_path.stat().st_size / 1024
+        if isinstance(result, asyncio.CancelledError):
+            print("   ⏭️  Skipped\n")
+            failed_count += 1
+        elif isinstance(result, Exception):
+            print(f"   ❌ Error: {result}\n")
+            failed_count += 1
+            quota_exceeded = quota_exceeded or is_quota_error(result)
+        else:
+            file_size = Path(result).stat().st_size / 1024
             print(f"   ✅ Success! ({file_size:.1f} KB)\n")
             success_count += 1
 
-        except Exception as e:
-            print(f"   ❌ Error: {e}\n")
-            failed_count += 1
-
-            # If quota exceeded, stop trying
-            if "quota_exceeded" in str(e):
-                print("⚠️  Credit limit reached. Stopping generation.")
-                print("   Add more credits to continue.\n")
-                break
+    # If quota exceeded, remaining phrases were not attempted
+    if quota_exceeded:
+        print("⚠️  Credit limit reached. Stopped generation.")
+        print("   Add more credits to continue.\n")
 
     print(f"📊 Summary:")
     print(f"   ✅ Generated: {success_count}")
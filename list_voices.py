@@ -2,36 +2,43 @@
 Script to list available voices from ElevenLabs account.
 """
 
-from elevenlabs.client import ElevenLabs
+import asyncio
+from elevenlabs.client import AsyncElevenLabs
 from src.config import settings
+from src.utils.http import async_keepalive_client
 
 
-def list_voices():
+async def list_voices():
     """List all available voices in your ElevenLabs account."""
 
-    client = ElevenLabs(api_key=settings.elevenlabs_api_key)
+    # Async client on a keep-alive HTTP/2 connection pool
+    async with async_keepalive_client() as http_client:
+        client = AsyncElevenLabs(
+            api_key=settings.elevenlabs_api_key,
+            httpx_client=http_client,
+        )
 
-    print("🎭 Fetching available voices from ElevenLabs...\n")
+        print("🎭 Fetching available voices from ElevenLabs...\n")
 
-    try:
-        voices = client.voices.get_all()
+        try:
+            voices = await client.voices.get_all()
 
-        print(f"Found {len(voices.voices)} voices:\n")
+            print(f"Found {len(voices.voices)} voices:\n")
 
-        for voice in voices.voices:
-            print(f"📝 Name: {voice.name}")
-            print(f"   ID: {voice.voice_id}")
-            print(f"   Category: {voice.category}")
-            if voice.labels:
-                print(f"   Labels: {voice.labels}")
-            print()
+            for voice in voices.voices:
+                print(f"📝 Name: {voice.name}")
+                print(f"   ID: {voice.voice_id}")
+                print(f"   Category: {voice.category}")
+                if voice.labels:
+                    print(f"   Labels: {voice.labels}")
+                print()
 
-        print("\n💡 To use a voice, copy its ID to your .env file:")
-        print("   ELEVENLABS_VOICE_ID=<voice_id>")
+            print("\n💡 To use a voice, copy its ID to your .env file:")
+            print("   ELEVENLABS_VOICE_ID=<voice_id>")
 
-    except Exception as e:
-        print(f"❌ Error fetching voices: {e}")
+        except Exception as e:
+            print(f"❌ Error fetching voices: {e}")
 
 
 if __name__ == "__main__":
-    list_voices()
+    asyncio.run(list_voices())
@@ -3,8 +3,13 @@ Configuration management for Ring Ring Who's There.
 Loads environment variables and provides type-safe settings.
 """
 
-from pydantic_settings import BaseSettings
-from typing import List
+import logging
+from functools import cached_property
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode
+from typing import Annotated, List, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class Settings(BaseSettings):
@@ -18,28 +23,60 @@ class Settings(BaseSettings):
     # ElevenLabs (TTS and STT)
     elevenlabs_api_key: str
     elevenlabs_voice_id: str
+    elevenlabs_requests_per_second: float = 2.0
+    tts_cache_dir: str = "audio_assets/.cache"  # Content-addressed TTS cache
 
     # Langfuse
     langfuse_public_key: str
     langfuse_secret_key: str
     langfuse_host: str = "https://cloud.langfuse.com"
+    langfuse_flush_at: int = 50  # Events batched before a background flush
+    langfuse_flush_interval: float = 5.0  # Seconds between background flushes
+    langfuse_enforce_flush: bool = False  # Flush after every doorbell event
+    langfuse_sample_rate: float = 1.0  # Fraction of doorbell events traced
+    langfuse_anomalies_only: bool = False  # Skip traces of routine successes
 
     # Application
-    passwords: str  # Comma-separated string, will be parsed to list
+    passwords: Annotated[Tuple[str, ...], NoDecode]  # Comma-separated in env
     fuzzy_threshold: int = 80
     recording_duration: int = 8
+    vad_rms_threshold: int = 500  # Recordings below this RMS count as silence
     max_attempts: int = 3
+    prepare_assets_on_startup: bool = True  # Generate missing prompt audio in warmup
     environment: str = "development"
     log_level: str = "INFO"
+    allowed_origins: str = "http://localhost:3000"  # Comma-separated CORS origins
 
     class Config:
         env_file = ".env"
         case_sensitive = False
+        frozen = True  # Loaded once at startup and never mutated
+
+    @field_validator("passwords", mode="before")
+    @classmethod
+    def _split_passwords(cls, value):
+        """Parse comma-separated passwords into a tuple once at load time."""
+        if isinstance(value, str):
+            return tuple(p.strip() for p in value.split(",") if p.strip())
+        return value
+
+    @field_validator("langfuse_sample_rate", mode="before")
+    @classmethod
+    def _check_sample_rate(cls, value):
+        """Fall back to tracing everything if the sample rate is invalid."""
+        try:
+            rate = float(value)
+        except (TypeError, ValueError):
+            rate = -1.0
+        if not 0.0 <= rate <= 1.0:
+            logger.warning("Invalid LANGFUSE_SAMPLE_RATE %r, using 1.0", value)
+            return 1.0
+        return rate
 
-    @property
-    def password_list(self) -> List[str]:
-        """Parse comma-separated passwords into a list."""
-        return [p.strip() for p in self.passwords.split(",") if p.strip()]
+    @cached_property
+    def allowed_origin_list(self) -> List[str]:
+        """Parse comma-separated CORS origins into a list (computed once)."""
+        return [o.strip() for o in self.allowed_origins.split(",") if o.strip()]
 
 
 # Global settings instance
@@ -12,6 +12,7 @@ Endpoints:
     POST /test/doorbell       - Test mock doorbell simulation
     POST /test/complete-flow  - Test complete authentication workflow
     POST /webhooks/ring/doorbell - Webhook for Ring doorbell events
+    GET  /audio/{file}        - Static prompt audio from audio_assets/
 
 Example:
     ```bash
@@ -30,9 +31,12 @@ See Also:
     src.services.password_service: Password matching logic
 """
 
-from fastapi import FastAPI, Query
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 import logging
+import orjson
 
 from src.config import settings
 
@@ -44,25 +48,75 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Services are imported once at startup (after logging is configured so their
+# initialization logs are emitted) rather than inside each request handler
+from src.services.mock_ring_service import mock_ring_service
+from src.services.password_service import password_service
+from src.workflows.doorbell_flow import doorbell_orchestrator
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm up the doorbell workflow before serving requests.
+
+    Runs the orchestrator warmup at startup so the first doorbell press,
+    which is latency critical, doesn't pay for initialization, and closes
+    its pooled connections on shutdown.
+    """
+    await doorbell_orchestrator.warmup()
+    yield
+    await doorbell_orchestrator.shutdown()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Ring Ring Who's There",
     description="A magical door opening system with witch voice authentication",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure this properly for production
+    allow_origins=settings.allowed_origin_list,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+# Serve prompt audio directly from disk so Ring devices can fetch it by URL
+# without the file passing through a request handler. The directory is only
+# checked on the first request, so the app still imports before assets exist.
+app.mount(
+    "/audio",
+    StaticFiles(directory="audio_assets", check_dir=False),
+    name="audio",
+)
+
+
+# Static bodies for the probe endpoints, encoded once at startup
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "environment": settings.environment,
+    "version": "0.1.0",
+})
+
+_ROOT_BYTES = orjson.dumps({
+    "message": "Ring Ring Who's There - Witch Voice Authentication System",
+    "docs": "/docs",
+    "test_endpoints": {
+        "password": "POST /test/password",
+        "mock_doorbell": "POST /test/doorbell",
+        "complete_flow": "POST /test/complete-flow",
+    }
+})
+
 
 @app.get("/health")
-async def health_check() -> dict:
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring and load balancers.
 
@@ -70,7 +124,7 @@ async def health_check() -> dict:
     should be used by monitoring systems to verify the service is running.
 
     Returns:
-        Dictionary containing:
+        JSON response containing:
             - status: Always "healthy" if endpoint is reachable
             - environment: Current environment (development/production)
             - version: Application version string
@@ -80,16 +134,16 @@ async def health_check() -> dict:
         curl http://localhost:8000/health
         # {"status": "healthy", "environment": "development", "version": "0.1.0"}
         ```
+
+    Note:
+        The body never changes at runtime, so it is pre-encoded at startup
+        and returned as-is to keep load balancer probes cheap.
     """
-    return {
-        "status": "healthy",
-        "environment": settings.environment,
-        "version": "0.1.0",
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/")
-async def root() -> dict:
+async def root() -> Response:
     """
     Root endpoint providing API information and available endpoints.
 
@@ -97,7 +151,7 @@ async def root() -> dict:
     and API documentation.
 
     Returns:
-        Dictionary containing:
+        JSON response containing:
             - message: Welcome message
             - docs: Path to Swagger/OpenAPI documentation
             - test_endpoints: Dictionary mapping endpoint names to their paths
@@ -107,15 +161,7 @@ async def root() -> dict:
         curl http://localhost:8000/
         ```
     """
-    return {
-        "message": "Ring Ring Who's There - Witch Voice Authentication System",
-        "docs": "/docs",
-        "test_endpoints": {
-            "password": "POST /test/password",
-            "mock_doorbell": "POST /test/doorbell",
-            "complete_flow": "POST /test/complete-flow",
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.post("/test/password")
@@ -157,8 +203,6 @@ async def test_password_matching(text: str = Query(..., description="Text to mat
         This endpoint uses the same password matching logic as the actual
         doorbell workflow, so results should be consistent.
     """
-    from src.services.password_service import password_service
-
     match, score, matched_pw = password_service.check_password(text)
 
     return {
@@ -206,12 +250,10 @@ async def test_mock_doorbell() -> dict:
         This uses the mock Ring service, so no actual Ring device is involved.
         Check the application logs for detailed output from the mock service.
     """
-    from src.services.mock_ring_service import mock_ring_service
-
     # Simulate doorbell press
     device_id = "mock-device-123"
 
-    logger.info(f"Test endpoint: Simulating doorbell press on {device_id}")
+    logger.info("Test endpoint: Simulating doorbell press on %s", device_id)
 
     # Play mock audio
     await mock_ring_service.play_audio(device_id, "audio_assets/witch_password.mp3")
@@ -279,15 +321,13 @@ async def test_complete_flow() -> dict:
         doesn't require actual hardware or API keys. All events are logged
         to Langfuse for observability.
     """
-    from src.workflows.doorbell_flow import doorbell_orchestrator
-
     device_id = "mock-device-123"
 
-    logger.info(f"🧪 Testing complete doorbell flow for {device_id}")
+    logger.info("🧪 Testing complete doorbell flow for %s", device_id)
 
     result = await doorbell_orchestrator.handle_doorbell_event(device_id)
 
-    logger.info(f"✅ Complete flow test finished: {result['status']}")
+    logger.info("✅ Complete flow test finished: %s", result["status"])
 
     return result
 
@@ -328,24 +368,38 @@ async def ring_doorbell_webhook(device_id: str = Query(default="mock-device-123"
         - Consider rate limiting to prevent abuse.
         - All events are logged to Langfuse for observability and debugging.
     """
-    from src.workflows.doorbell_flow import doorbell_orchestrator
-
-    logger.info(f"🔔 Webhook: Doorbell pressed on {device_id}")
+    logger.info("🔔 Webhook: Doorbell pressed on %s", device_id)
 
     # Execute the complete doorbell workflow
     result = await doorbell_orchestrator.handle_doorbell_event(device_id)
 
-    logger.info(f"Webhook result: {result['status']}")
+    logger.info("Webhook result: %s", result["status"])
 
     return result
 
 
 if __name__ == "__main__":
+    import asyncio
+    import os
     import uvicorn
 
+    is_development = settings.environment == "development"
+    # Reload mode only supports a single worker
+    workers = 1 if is_development else (os.cpu_count() or 1)
+
+    if workers > 1 and settings.prepare_assets_on_startup:
+        # Generate prompt audio once here; the workers inherit the env
+        # override and skip it, instead of each calling ElevenLabs for
+        # the same prompts and racing on the joined file
+        asyncio.run(doorbell_orchestrator.prepare_assets())
+        os.environ["PREPARE_ASSETS_ON_STARTUP"] = "false"
+
     uvicorn.run(
         "src.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True if settings.environment == "development" else False,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        reload=is_development,
     )
@@ -5,12 +5,29 @@ Simulates Ring doorbell behavior without actual hardware.
 
 import logging
 import asyncio
+import os
+import time
 from pathlib import Path
-from typing import Optional, Callable
+from typing import AsyncIterator, Optional, Callable
 
 logger = logging.getLogger(__name__)
 
 
+# Prompt files that were found once; prompts are replayed on every event.
+# Misses aren't remembered, since prompts can be generated after startup.
+_known_files: set[str] = set()
+
+
+def _file_exists(path: str) -> bool:
+    """Check if an audio file exists, remembering only positive results."""
+    if path in _known_files:
+        return True
+    if os.path.isfile(path):
+        _known_files.add(path)
+        return True
+    return False
+
+
 class MockRingService:
     """
     Mock Ring service that simulates doorbell events and audio operations.
@@ -24,9 +41,14 @@ class MockRingService:
 
         # Mock audio recording (returns test audio file path)
         audio_path = await mock_ring.record_audio("mock-device-123", duration=8)
+
+    Args:
+        simulate_latency: Sleep to mimic network, playback and recording
+            delays. Pass False in automated tests to skip the waits.
     """
 
-    def __init__(self):
+    def __init__(self, simulate_latency: bool = True):
+        self.simulate_latency = simulate_latency
         self.authenticated = True
         self.devices = {
             "mock-device-123": {
@@ -41,7 +63,8 @@ class MockRingService:
     async def authenticate(self) -> bool:
         """Mock authentication - always succeeds."""
         logger.info("Mock: Authentication successful")
-        await asyncio.sleep(0.1)  # Simulate network delay
+        if self.simulate_latency:
+            await asyncio.sleep(0.1)  # Simulate network delay
         self.authenticated = True
         return True
 
@@ -57,14 +80,16 @@ class MockRingService:
         Args:
             device_id: Mock device ID
         """
-        logger.info(f"🔔 Simulating doorbell press on {device_id}")
+        logger.info("🔔 Simulating doorbell press on %s", device_id)
 
         if self._event_callback:
+            device = self.devices.get(device_id, {})
             event_data = {
                 "event_type": "doorbell_pressed",
                 "device_id": device_id,
-                "device_name": self.devices[device_id]["name"],
-                "timestamp": asyncio.get_event_loop().time(),
+                "device_name": device.get("name"),
+                # Same monotonic clock as the event loop, without the loop lookup
+                "timestamp": time.monotonic(),
             }
             await self._event_callback(event_data)
         else:
@@ -81,16 +106,40 @@ class MockRingService:
         Returns:
             True (always succeeds in mock)
         """
-        logger.info(f"🔊 Mock: Playing audio on {device_id}: {audio_file_path}")
+        logger.info("🔊 Mock: Playing audio on %s: %s", device_id, audio_file_path)
 
         # Check if file exists
-        if not Path(audio_file_path).exists():
-            logger.warning(f"Audio file not found: {audio_file_path}")
+        if not _file_exists(audio_file_path):
+            logger.warning("Audio file not found: %s", audio_file_path)
             logger.info("   (This is OK in mock mode - audio would play if file existed)")
 
         # Simulate audio playback delay
-        await asyncio.sleep(0.5)
-        logger.info(f"✅ Mock: Audio playback complete")
+        if self.simulate_latency:
+            await asyncio.sleep(0.5)
+        logger.info("✅ Mock: Audio playback complete")
+        return True
+
+    async def play_stream(self, device_id: str, chunks: AsyncIterator[bytes]) -> bool:
+        """
+        Mock streamed playback of raw PCM audio through Ring speaker.
+
+        Consumes the chunks as they arrive, the way a real speaker would
+        start playing the first chunk while later ones are still generated.
+
+        Args:
+            device_id: Ring device ID
+            chunks: Async iterator of PCM audio chunks
+
+        Returns:
+            True (always succeeds in mock)
+        """
+        logger.info("🔊 Mock: Streaming audio on %s", device_id)
+
+        total_bytes = 0
+        async for chunk in chunks:
+            total_bytes += len(chunk)
+
+        logger.info("✅ Mock: Streamed playback complete (%s bytes)", total_bytes)
         return True
 
     async def record_audio(
@@ -107,43 +156,80 @@ class MockRingService:
         Returns:
             Path to test audio file, or None
         """
-        logger.info(f"🎤 Mock: Recording audio from {device_id} for {duration}s")
+        logger.info("🎤 Mock: Recording audio from %s for %ss", device_id, duration)
 
         # Simulate recording delay
-        await asyncio.sleep(duration * 0.1)  # 10% of actual duration for testing
+        if self.simulate_latency:
+            await asyncio.sleep(duration * 0.1)  # 10% of actual duration for testing
 
-        # Look for test audio files in audio_assets directory
-        test_audio_dir = Path("audio_assets")
+        test_file = self._find_test_audio()
+        if test_file:
+            return test_file
 
-        # Try to find a test audio file
-        test_files = []
-        if test_audio_dir.exists():
-            test_files = list(test_audio_dir.glob("test_*.mp3")) + \
-                        list(test_audio_dir.glob("test_*.wav"))
+        # Return a mock path (file doesn't exist yet)
+        mock_path = "audio_assets/mock_recording.mp3"
+        logger.info("   Returning mock path: %s", mock_path)
+        return mock_path
 
-        if test_files:
-            test_file = test_files[0]
-            logger.info(f"✅ Mock: Using test audio file: {test_file}")
-            return str(test_file)
-        else:
-            logger.warning("No test audio files found in audio_assets/")
-            logger.info("   Create test_password.mp3 in audio_assets/ to test STT")
+    async def record_audio_stream(
+        self, device_id: str, duration: int = 8
+    ) -> Optional[bytes]:
+        """
+        Mock in-memory audio recording from Ring microphone.
+        Returns the recorded audio directly instead of a file path, so the
+        caller can hand it to STT without a disk round-trip.
 
-            # Return a mock path (file doesn't exist yet)
-            mock_path = "audio_assets/mock_recording.mp3"
-            logger.info(f"   Returning mock path: {mock_path}")
-            return mock_path
+        Args:
+            device_id: Ring device ID
+            duration: Recording duration in seconds
+
+        Returns:
+            Audio bytes of a test audio file, or None if none is available
+        """
+        logger.info("🎤 Mock: Recording audio from %s for %ss", device_id, duration)
+
+        # Simulate recording delay
+        if self.simulate_latency:
+            await asyncio.sleep(duration * 0.1)  # 10% of actual duration for testing
+
+        test_file = self._find_test_audio()
+        if not test_file:
+            return None
+        return await asyncio.to_thread(Path(test_file).read_bytes)
+
+    @staticmethod
+    def _find_test_audio() -> Optional[str]:
+        """Return the first test audio file in audio_assets/, if any."""
+        # Single directory scan, stopping at the first hit
+        try:
+            with os.scandir("audio_assets") as entries:
+                for entry in entries:
+                    if (
+                        entry.name.startswith("test_")
+                        and entry.name.endswith((".mp3", ".wav"))
+                        and entry.is_file()
+                    ):
+                        logger.info("✅ Mock: Using test audio file: %s", entry.path)
+                        return entry.path
+        except FileNotFoundError:
+            pass
+
+        logger.warning("No test audio files found in audio_assets/")
+        logger.info("   Create test_password.mp3 in audio_assets/ to test STT")
+        return None
 
     async def get_devices(self):
         """Get list of mock devices."""
         logger.info("Mock: Fetching devices")
-        await asyncio.sleep(0.1)
+        if self.simulate_latency:
+            await asyncio.sleep(0.1)
         return self.devices
 
     async def get_device_info(self, device_id: str):
         """Get mock device information."""
-        logger.info(f"Mock: Getting info for device {device_id}")
-        await asyncio.sleep(0.1)
+        logger.info("Mock: Getting info for device %s", device_id)
+        if self.simulate_latency:
+            await asyncio.sleep(0.1)
         return self.devices.get(device_id)
 
 
@@ -6,6 +6,8 @@ Validates spoken passwords against configured password list.
 from rapidfuzz import fuzz, process
 import jellyfish
 import logging
+import unicodedata
+from functools import lru_cache
 from typing import Tuple, Optional
 
 from src.config import settings
@@ -13,14 +15,41 @@ from src.config import settings
 logger = logging.getLogger(__name__)
 
 
+def _normalize(text: str) -> str:
+    """
+    Normalize text for matching: case-folded, accents stripped.
+
+    NFKD splits accented letters into base letter plus combining mark, so
+    "Alohomorá" and "alohomora" compare equal.
+    """
+    decomposed = unicodedata.normalize("NFKD", text.strip().casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=128)
+def _cached_metaphone(text: str) -> str:
+    """Metaphone code of text, cached for repeated guesses of the same word."""
+    return jellyfish.metaphone(text)
+
+
 class PasswordService:
     """Password validation with fuzzy and phonetic matching."""
 
     def __init__(self, passwords: list[str] = None, threshold: int = None):
-        self.passwords = passwords or settings.password_list
+        self.passwords = passwords or settings.passwords
         self.threshold = threshold or settings.fuzzy_threshold
+        # Normalized forms and metaphone codes are computed once here
+        # instead of on every check
+        self._passwords_lower = tuple(_normalize(p) for p in self.passwords)
+        # Maps each normalized password back to its original form
+        self._exact_map = dict(zip(self._passwords_lower, self.passwords))
+        self._passwords_metaphone = tuple(
+            jellyfish.metaphone(p) for p in self._passwords_lower
+        )
         logger.info(
-            f"Initialized PasswordService with {len(self.passwords)} passwords, threshold: {self.threshold}"
+            "Initialized PasswordService with %s passwords, threshold: %s",
+            len(self.passwords),
+            self.threshold,
         )
 
     def check_password(self, spoken_text: str) -> Tuple[bool, float, Optional[str]]:
@@ -37,80 +66,73 @@ class PasswordService:
             logger.warning("Empty spoken text provided")
             return False, 0.0, None
 
-        spoken_text = spoken_text.strip().lower()
-        logger.info(f"Checking password for: '{spoken_text}'")
-
-        # Try exact match first (case-insensitive)
-        for password in self.passwords:
-            if password.lower() == spoken_text:
-                logger.info(f"Exact match found: {password}")
-                return True, 100.0, password
-
-        # Fuzzy matching with rapidfuzz
-        best_match = self._fuzzy_match(spoken_text)
-        if best_match:
-            match, score, password = best_match
-            if score >= self.threshold:
-                logger.info(
-                    f"Fuzzy match found: '{password}' (score: {score:.2f})"
-                )
-                return True, score, password
+        spoken_text = _normalize(spoken_text)
+        logger.info("Checking password for: '%s'", spoken_text)
+
+        # Try exact match first (case- and accent-insensitive)
+        password = self._exact_map.get(spoken_text)
+        if password is not None:
+            logger.info("Exact match found: %s", password)
+            return True, 100.0, password
+
+        # Fuzzy matching with rapidfuzz. One scan without a cutoff, so a miss
+        # still has its best score for diagnostics.
+        best_score, password = self._fuzzy_match(spoken_text)
+        if best_score >= self.threshold:
+            logger.info("Fuzzy match found: '%s' (score: %.2f)", password, best_score)
+            return True, best_score, password
 
         # Phonetic matching as fallback
         phonetic_match = self._phonetic_match(spoken_text)
         if phonetic_match:
             match, score, password = phonetic_match
-            if score >= self.threshold:
-                logger.info(
-                    f"Phonetic match found: '{password}' (score: {score:.2f})"
-                )
-                return True, score, password
+            logger.info("Phonetic match found: '%s' (score: %.2f)", password, score)
+            return True, score, password
 
-        logger.info(f"No match found for: '{spoken_text}'")
-        return False, best_match[1] if best_match else 0.0, None
+        logger.info("No match found for: '%s'", spoken_text)
+        # Report the best (below threshold) fuzzy score for diagnostics
+        return False, best_score, None
 
-    def _fuzzy_match(self, spoken_text: str) -> Optional[Tuple[bool, float, str]]:
-        """Perform fuzzy matching using Levenshtein distance."""
-        passwords_lower = [p.lower() for p in self.passwords]
+    def _fuzzy_match(self, spoken_text: str) -> Tuple[float, Optional[str]]:
+        """
+        Perform fuzzy matching using Levenshtein distance.
+
+        Args:
+            spoken_text: The normalized spoken text
 
+        Returns:
+            Tuple of (score, password) for the best candidate, whether or not
+            it reaches the threshold; (0.0, None) without passwords
+        """
         # Use rapidfuzz to find best match
         result = process.extractOne(
             spoken_text,
-            passwords_lower,
+            self._passwords_lower,
             scorer=fuzz.ratio,
         )
 
         if result:
-            matched_lower, score, index = result
-            original_password = self.passwords[index]
-            return True, score, original_password
+            _, score, index = result
+            return score, self.passwords[index]
 
-        return None
+        return 0.0, None
 
     def _phonetic_match(self, spoken_text: str) -> Optional[Tuple[bool, float, str]]:
         """Perform phonetic matching using Metaphone algorithm."""
-        spoken_metaphone = jellyfish.metaphone(spoken_text)
-
-        best_score = 0.0
-        best_password = None
-
-        for password in self.passwords:
-            password_metaphone = jellyfish.metaphone(password.lower())
+        spoken_metaphone = _cached_metaphone(spoken_text)
 
-            # Calculate similarity between metaphone codes
-            if spoken_metaphone == password_metaphone:
-                # Exact phonetic match
-                score = 100.0
-            else:
-                # Use Levenshtein on metaphone codes
-                score = fuzz.ratio(spoken_metaphone, password_metaphone)
-
-            if score > best_score:
-                best_score = score
-                best_password = password
+        # Levenshtein on metaphone codes in a single rapidfuzz call;
+        # identical codes score 100 and the cutoff prunes hopeless candidates
+        result = process.extractOne(
+            spoken_metaphone,
+            self._passwords_metaphone,
+            scorer=fuzz.ratio,
+            score_cutoff=self.threshold,
+        )
 
-        if best_password and best_score > 0:
-            return True, best_score, best_password
+        if result:
+            _, score, index = result
+            return True, score, self.passwords[index]
 
         return None
 
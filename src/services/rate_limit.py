@@ -0,0 +1,90 @@
+"""
+Rate limiting for outbound API calls.
+Paces ElevenLabs requests so bursts don't run into 429 responses.
+"""
+
+import asyncio
+import logging
+import time
+
+from elevenlabs.core.api_error import ApiError
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Async token bucket limiter.
+
+    Tokens refill continuously at `rate_per_sec` up to `capacity`. Each call
+    consumes tokens and waits until enough are available, so callers are
+    paced before the API would reject them.
+
+    SDK calls like `text_to_speech.convert` return lazy generators that only
+    send the request once iterated, so consume them inside the block.
+
+    Usage:
+        async with elevenlabs_rate_limiter:
+            audio = await asyncio.to_thread(
+                lambda: b"".join(client.text_to_speech.convert(...))
+            )
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float = None):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = max(1.0, capacity or rate_per_sec)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_sec
+        )
+        self._updated_at = now
+
+    async def acquire(self, cost: float = 1.0) -> None:
+        """
+        Wait until `cost` tokens are available and consume them.
+
+        Args:
+            cost: Number of tokens the call consumes
+        """
+        async with self._lock:
+            self._refill()
+            while self._tokens < cost:
+                wait = (cost - self._tokens) / self.rate_per_sec
+                logger.debug("Rate limit reached, waiting %.2fs", wait)
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= cost
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+def is_quota_error(error: BaseException) -> bool:
+    """
+    Check whether an ElevenLabs error means further requests will fail too.
+
+    Args:
+        error: Exception raised by an ElevenLabs SDK call
+
+    Returns:
+        True for rate limit (429) and exhausted-quota responses
+    """
+    if not isinstance(error, ApiError):
+        return False
+    return error.status_code == 429 or "quota_exceeded" in str(error.body)
+
+
+# Global limiter shared by all ElevenLabs calls
+elevenlabs_rate_limiter = TokenBucket(settings.elevenlabs_requests_per_second)
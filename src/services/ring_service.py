@@ -155,7 +155,7 @@ class RingService:
             Currently not implemented. This will use the Ring API's audio
             playback functionality once integrated.
         """
-        logger.info(f"Playing audio on device {device_id}: {audio_file_path}")
+        logger.info("Playing audio on device %s: %s", device_id, audio_file_path)
         # TODO: Implement audio playback
         logger.warning("Ring audio playback not yet implemented")
         return False
@@ -198,7 +198,7 @@ class RingService:
             Currently not implemented. This will use the Ring API's audio
             recording functionality once integrated.
         """
-        logger.info(f"Recording audio from device {device_id} for {duration}s")
+        logger.info("Recording audio from device %s for %ss", device_id, duration)
         # TODO: Implement audio recording
         logger.warning("Ring audio recording not yet implemented")
         return None
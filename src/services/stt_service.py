@@ -3,22 +3,48 @@ Speech-to-Text service using ElevenLabs API.
 Transcribes audio from Ring doorbell to text.
 """
 
-from elevenlabs.client import ElevenLabs
+from elevenlabs.client import AsyncElevenLabs
 from pathlib import Path
+from typing import NamedTuple
+import asyncio
 import logging
+import time
 
 from src.config import settings
+from src.utils.http import async_keepalive_client
 
 logger = logging.getLogger(__name__)
 
 
+class TranscriptionResult(NamedTuple):
+    """Transcribed text with its metadata."""
+
+    text: str
+    language: str
+    confidence: float
+    duration_ms: float  # Time spent transcribing
+    mock: bool = False
+
+
 class STTService:
     """Speech-to-Text service for transcribing audio using ElevenLabs."""
 
     def __init__(self):
-        self.client = ElevenLabs(api_key=settings.elevenlabs_api_key)
-
-    async def transcribe(self, audio_file_path: str, language: str = "de") -> dict:
+        # Pooled HTTP/2 connection shared by all transcriptions, so only the
+        # first doorbell event pays the TCP/TLS handshake
+        self._http = async_keepalive_client(timeout=30)
+        self.client = AsyncElevenLabs(
+            api_key=settings.elevenlabs_api_key,
+            httpx_client=self._http,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections (call on application shutdown)."""
+        await self._http.aclose()
+
+    async def transcribe(
+        self, audio_file_path: str, language: str = "de"
+    ) -> TranscriptionResult:
         """
         Transcribe audio file to text using ElevenLabs STT.
 
@@ -27,15 +53,37 @@ class STTService:
             language: Language code (e.g., 'de' for German, 'en' for English)
 
         Returns:
-            Dictionary with transcription text and metadata
+            TranscriptionResult with the text, metadata and duration
         """
-        logger.info(f"Transcribing audio file: {audio_file_path}")
+        logger.info("Transcribing audio file: %s", audio_file_path)
 
         try:
-            # Read audio file
-            with open(audio_file_path, "rb") as audio_file:
-                audio_data = audio_file.read()
+            # Read audio file in a worker thread so the event loop keeps
+            # serving other doorbell events during the disk read
+            audio_data = await asyncio.to_thread(Path(audio_file_path).read_bytes)
+        except Exception as e:
+            logger.error("Failed to transcribe audio: %s", e)
+            raise
+
+        return await self.transcribe_bytes(audio_data, language)
+
+    async def transcribe_bytes(
+        self, audio_data: bytes, language: str = "de"
+    ) -> TranscriptionResult:
+        """
+        Transcribe in-memory audio to text using ElevenLabs STT.
 
+        Args:
+            audio_data: Encoded audio (e.g. MP3 or WAV) as recorded
+            language: Language code (e.g., 'de' for German, 'en' for English)
+
+        Returns:
+            TranscriptionResult with the text, metadata and duration
+        """
+        logger.info("Transcribing %s bytes of audio", len(audio_data))
+        start_time = time.perf_counter()
+
+        try:
             # For now, use a mock transcription since ElevenLabs STT API
             # might have different endpoints/methods
             # TODO: Update with actual ElevenLabs STT API when available
@@ -45,20 +93,19 @@ class STTService:
 
             # For testing, return a mock result
             # In production, this would call the actual ElevenLabs STT API
-            result = {
-                "text": "alohomora",  # Mock transcription
-                "language": language,
-                "confidence": 0.95,
-                "mock": True
-            }
-
-            logger.info(
-                f"Transcription (MOCK): '{result['text']}'"
+            result = TranscriptionResult(
+                text="alohomora",  # Mock transcription
+                language=language,
+                confidence=0.95,
+                duration_ms=(time.perf_counter() - start_time) * 1000,
+                mock=True,
             )
+
+            logger.info("Transcription (MOCK): '%s'", result.text)
             return result
 
         except Exception as e:
-            logger.error(f"Failed to transcribe audio: {e}")
+            logger.error("Failed to transcribe audio: %s", e)
             raise
 
 
@@ -68,7 +115,6 @@ stt_service = STTService()
 
 if __name__ == "__main__":
     # Test script for STT service
-    import asyncio
     import sys
 
     async def test_stt():
@@ -78,8 +124,8 @@ if __name__ == "__main__":
 
         audio_file = sys.argv[1]
         result = await stt_service.transcribe(audio_file)
-        print(f"Transcription: {result['text']}")
-        print(f"Language: {result['language']}")
-        print(f"Duration: {result['duration']}s")
+        print(f"Transcription: {result.text}")
+        print(f"Language: {result.language}")
+        print(f"Duration: {result.duration_ms:.0f}ms")
 
     asyncio.run(test_stt())
@@ -4,28 +4,84 @@ Tracks all operations, latencies, and errors.
 """
 
 from langfuse import Langfuse
-from functools import wraps
+from functools import cache, wraps
+import asyncio
+import hashlib
+import reprlib
 import time
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Initialize Langfuse client
-langfuse = Langfuse(
-    public_key=settings.langfuse_public_key,
-    secret_key=settings.langfuse_secret_key,
-    host=settings.langfuse_host,
-)
+# Bounded repr for trace outputs: large results are truncated while being
+# converted instead of being stringified in full first
+_result_repr = reprlib.Repr()
+_result_repr.maxstring = 500
+_result_repr.maxother = 500
+_result_repr.maxlist = 10
+_result_repr.maxdict = 10
+
+
+@cache
+def get_langfuse() -> Langfuse:
+    """
+    Return the shared Langfuse client, creating it on first use.
+
+    Creation is deferred so importing this module stays cheap on cold
+    starts. Trace updates are queued locally and shipped in batches by the
+    SDK's background thread, so traced calls never wait on network I/O;
+    pending events are flushed by the SDK at interpreter exit.
+    """
+    return Langfuse(
+        public_key=settings.langfuse_public_key,
+        secret_key=settings.langfuse_secret_key,
+        host=settings.langfuse_host,
+        flush_at=settings.langfuse_flush_at,
+        flush_interval=settings.langfuse_flush_interval,
+    )
+
+
+def should_sample(key: str, rate: float) -> bool:
+    """
+    Decide deterministically whether to trace the operation identified by key.
+
+    The key is hashed to a number in [0, 1), so the same key always gets
+    the same decision and roughly `rate` of all keys are traced.
+
+    Args:
+        key: Identifier of the traced operation
+        rate: Fraction of operations to trace (0.0 to 1.0)
+
+    Returns:
+        True if the operation should be traced
+    """
+    if rate >= 1.0:
+        return True
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64 < rate
+
+
+def flush_langfuse() -> None:
+    """
+    Send all queued trace events now (blocking).
+
+    Does nothing if no Langfuse client has been created yet, so flushing
+    never pays for client creation.
+    """
+    if get_langfuse.cache_info().currsize:
+        get_langfuse().flush()
 
 
 class TracingService:
     """Service for tracing operations with Langfuse."""
 
-    def __init__(self):
-        self.client = langfuse
+    @property
+    def client(self) -> Langfuse:
+        """The shared Langfuse client (created lazily)."""
+        return get_langfuse()
 
     def trace_function(self, name: str, metadata: dict = None):
         """
@@ -42,88 +98,82 @@ class TracingService:
         """
 
         def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                trace = self.client.trace(name=name, metadata=metadata or {})
-                start_time = time.time()
+            # Only build the wrapper matching the function type
+            if asyncio.iscoroutinefunction(func):
 
-                try:
-                    result = await func(*args, **kwargs)
-                    latency = time.time() - start_time
-
-                    trace.update(
-                        output={"result": str(result)[:500]},  # Truncate long outputs
-                        metadata={
-                            **(metadata or {}),
-                            "latency_ms": round(latency * 1000, 2),
-                            "status": "success",
-                        },
-                    )
-
-                    logger.debug(f"Traced {name}: {latency:.3f}s")
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    trace = self.client.trace(name=name, metadata=metadata or {})
+                    start_time = time.perf_counter()
+
+                    try:
+                        result = await func(*args, **kwargs)
+                    except Exception as e:
+                        self._finalize(trace, name, start_time, metadata, error=e)
+                        raise
+
+                    self._finalize(trace, name, start_time, metadata, result=result)
                     return result
 
-                except Exception as e:
-                    latency = time.time() - start_time
-
-                    trace.update(
-                        metadata={
-                            **(metadata or {}),
-                            "latency_ms": round(latency * 1000, 2),
-                            "status": "error",
-                            "error": str(e),
-                        },
-                    )
-
-                    logger.error(f"Traced {name} failed: {e}")
-                    raise
+                return async_wrapper
 
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
                 trace = self.client.trace(name=name, metadata=metadata or {})
-                start_time = time.time()
+                start_time = time.perf_counter()
 
                 try:
                     result = func(*args, **kwargs)
-                    latency = time.time() - start_time
-
-                    trace.update(
-                        output={"result": str(result)[:500]},
-                        metadata={
-                            **(metadata or {}),
-                            "latency_ms": round(latency * 1000, 2),
-                            "status": "success",
-                        },
-                    )
-
-                    logger.debug(f"Traced {name}: {latency:.3f}s")
-                    return result
-
                 except Exception as e:
-                    latency = time.time() - start_time
-
-                    trace.update(
-                        metadata={
-                            **(metadata or {}),
-                            "latency_ms": round(latency * 1000, 2),
-                            "status": "error",
-                            "error": str(e),
-                        },
-                    )
-
-                    logger.error(f"Traced {name} failed: {e}")
+                    self._finalize(trace, name, start_time, metadata, error=e)
                     raise
 
-            # Return appropriate wrapper based on function type
-            import asyncio
+                self._finalize(trace, name, start_time, metadata, result=result)
+                return result
 
-            if asyncio.iscoroutinefunction(func):
-                return async_wrapper
-            else:
-                return sync_wrapper
+            return sync_wrapper
 
         return decorator
 
+    @staticmethod
+    def _finalize(
+        trace: Any,
+        name: str,
+        start_time: float,
+        metadata: Optional[dict],
+        result: Any = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """
+        Record the outcome and latency of a traced call on its trace.
+
+        Args:
+            trace: The Langfuse trace created for the call
+            name: Name of the traced operation
+            start_time: `time.perf_counter()` value taken before the call
+            metadata: Metadata passed to the decorator
+            result: Return value of the call (on success)
+            error: Exception raised by the call (on failure)
+        """
+        latency = time.perf_counter() - start_time
+        trace_metadata = {
+            **(metadata or {}),
+            "latency_ms": round(latency * 1000, 2),
+        }
+
+        if error is not None:
+            trace.update(
+                metadata={**trace_metadata, "status": "error", "error": str(error)},
+            )
+            logger.error("Traced %s failed: %s", name, error)
+            return
+
+        trace.update(
+            output={"result": _result_repr.repr(result)},
+            metadata={**trace_metadata, "status": "success"},
+        )
+        logger.debug("Traced %s: %.3fs", name, latency)
+
     def log_event(
         self,
         name: str,
@@ -150,10 +200,10 @@ class TracingService:
             )
 
             if metadata:
-                logger.debug(f"Logged event {name}: {metadata}")
+                logger.debug("Logged event %s: %s", name, metadata)
 
         except Exception as e:
-            logger.error(f"Failed to log event {name}: {e}")
+            logger.error("Failed to log event %s: %s", name, e)
 
 
 # Global tracing service instance
@@ -162,8 +212,6 @@ tracing_service = TracingService()
 
 if __name__ == "__main__":
     # Test script for tracing service
-    import asyncio
-
     @tracing_service.trace_function("test_operation")
     async def test_operation():
         await asyncio.sleep(0.1)
@@ -15,17 +15,55 @@ Example:
 
 Note:
     The service uses the "eleven_multilingual_v2" model which supports
-    multiple languages including German and English.
+    multiple languages including German and English. Generated audio is
+    cached on disk by content hash, so repeated prompts skip the API call.
+    `generate_audio_stream` yields raw PCM while it is synthesized, for
+    prompts that should start playing before the whole file exists.
 """
 
 from elevenlabs.client import ElevenLabs
+from elevenlabs.core.api_error import ApiError
 from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Set, Union
+import asyncio
+import hashlib
 import logging
+import os
+import shutil
+import tempfile
 
 from src.config import settings
+from src.services.rate_limit import elevenlabs_rate_limiter, is_quota_error
+from src.utils.http import keepalive_client
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MODEL_ID = "eleven_multilingual_v2"
+STREAM_OUTPUT_FORMAT = "pcm_16000"  # 16 kHz 16-bit mono, no decoding needed
+TTS_CACHE_DIR = Path(settings.tts_cache_dir)
+
+
+def cache_path(
+    text: str, voice_id: str, model_id: str = DEFAULT_MODEL_ID, suffix: str = ".mp3"
+) -> Path:
+    """
+    Return the content-addressed cache location for a synthesized phrase.
+
+    The key is a SHA-256 of voice, model and text, so changing any of them
+    produces a new cache entry.
+
+    Args:
+        text: The text that is synthesized.
+        voice_id: The ElevenLabs voice ID.
+        model_id: The ElevenLabs model ID.
+        suffix: File extension for the audio format (".mp3" or ".pcm").
+
+    Returns:
+        Path to the cached audio file (which may not exist yet).
+    """
+    key = hashlib.sha256(f"{voice_id}|{model_id}|{text}".encode()).hexdigest()
+    return TTS_CACHE_DIR / f"{key}{suffix}"
+
 
 class TTSService:
     """
@@ -40,20 +78,37 @@ class TTSService:
         voice_id (str): The voice ID to use for speech generation.
     """
 
-    def __init__(self, voice_id: str = None):
+    def __init__(self, voice_id: str = None, client: ElevenLabs = None):
         """
         Initialize the TTS service with ElevenLabs API credentials.
         
         Args:
             voice_id: Optional voice ID to override the default from settings.
                 If not provided, uses the voice ID from configuration.
+            client: Optional preconfigured ElevenLabs client. If not
+                provided, one is created from the configured API key on a
+                pooled keep-alive connection.
         
         Raises:
             ValueError: If ElevenLabs API key is not configured.
         """
-        self.client = ElevenLabs(api_key=settings.elevenlabs_api_key)
+        self._http = None
+        if client is None:
+            # Pooled HTTP/2 connection shared by all syntheses, so only the
+            # first request pays the TCP/TLS handshake
+            self._http = keepalive_client()
+            client = ElevenLabs(
+                api_key=settings.elevenlabs_api_key,
+                httpx_client=self._http,
+            )
+        self.client = client
         self.voice_id = voice_id or settings.elevenlabs_voice_id
 
+    def close(self) -> None:
+        """Close the pooled HTTP connections (call on application shutdown)."""
+        if self._http is not None:
+            self._http.close()
+
     async def generate_audio(self, text: str, output_path: str) -> str:
         """
         Generate audio from text using ElevenLabs TTS API.
@@ -89,35 +144,229 @@ class TTSService:
 
         Note:
             Uses the "eleven_multilingual_v2" model which supports multiple
-            languages. The audio is streamed in chunks and written to disk.
+            languages. The download and the disk write run in worker threads
+            so concurrent generations overlap instead of blocking the event
+            loop. If the same text was already generated with the same
+            voice, the cached file is copied instead of calling the API.
         """
-        logger.info(f"Generating audio for text: {text}")
+        return await self._generate_audio(text, output_path)
 
-        try:
-            # Generate audio using ElevenLabs client
-            audio_generator = self.client.text_to_speech.convert(
-                voice_id=self.voice_id,
-                text=text,
-                model_id="eleven_multilingual_v2",
-            )
+    async def _generate_audio(
+        self,
+        text: str,
+        output_path: str,
+        started: Optional[Set[asyncio.Task]] = None,
+    ) -> str:
+        """
+        Generate one audio file, optionally reporting when the API call starts.
 
-            # Save audio to file
+        Args:
+            text: The text to convert to speech.
+            output_path: Path where the generated audio file should be saved.
+            started: If given, the current task is added once it has passed
+                the rate limiter and is about to call the API.
+
+        Returns:
+            The path to the generated audio file as a string.
+        """
+        logger.info("Generating audio for text: %s", text)
+
+        try:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write audio chunks to file
-            with open(output_file, "wb") as f:
-                for chunk in audio_generator:
-                    if chunk:
-                        f.write(chunk)
+            cached_file = cache_path(text, self.voice_id)
+            if cached_file.exists():
+                logger.info("Using cached audio: %s", cached_file)
+                await asyncio.to_thread(shutil.copyfile, cached_file, output_file)
+                return str(output_file)
+
+            # Generate audio using ElevenLabs client
+            async with elevenlabs_rate_limiter:
+                if started is not None:
+                    started.add(asyncio.current_task())
+                audio_data = await asyncio.to_thread(self._synthesize, text)
 
-            logger.info(f"Audio saved to: {output_file}")
+            await asyncio.to_thread(self._store, audio_data, cached_file, output_file)
+
+            logger.info("Audio saved to: %s", output_file)
             return str(output_file)
 
         except Exception as e:
-            logger.error(f"Failed to generate audio: {e}")
+            logger.error("Failed to generate audio: %s", e)
             raise
 
+    async def generate_many(
+        self, phrases: Dict[str, str]
+    ) -> List[Union[str, BaseException]]:
+        """
+        Generate several audio files concurrently.
+
+        All phrases are dispatched at once, so downloads and disk writes of
+        different phrases overlap. If ElevenLabs reports an exhausted quota
+        or rate limit, requests still waiting on the rate limiter are
+        cancelled instead of spending more API calls. Requests already sent
+        are left to finish, so the audio they were charged for is stored.
+
+        Args:
+            phrases: Mapping of output file path to the text to synthesize.
+
+        Returns:
+            One entry per phrase, in input order: the generated file path,
+            the exception raised for it, or `asyncio.CancelledError` if it
+            was skipped after a quota error.
+
+        Example:
+            ```python
+            results = await tts_service.generate_many({
+                "audio_assets/witch_password.mp3": "Passwort?",
+                "audio_assets/witch_welcome.mp3": "Willkommen!",
+            })
+            ```
+        """
+        tasks: List[asyncio.Task] = []
+        started: Set[asyncio.Task] = set()
+
+        async def generate(output_path: str, text: str) -> str:
+            try:
+                return await self._generate_audio(text, output_path, started)
+            except ApiError as e:
+                # Out of credits: cancel the requests that haven't called the API
+                if is_quota_error(e):
+                    for task in tasks:
+                        if task not in started:
+                            task.cancel()
+                raise
+
+        tasks.extend(
+            asyncio.create_task(generate(output_path, text))
+            for output_path, text in phrases.items()
+        )
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def warm_cache(self, prompts: Dict[str, str]) -> List[str]:
+        """
+        Pre-generate prompt audio files that are missing on disk.
+
+        Called at startup so the first doorbell press plays from disk
+        instead of waiting for synthesis. Existing files are left alone, and
+        missing ones are restored from the cache when the same text was
+        generated before.
+
+        Args:
+            prompts: Mapping of output file path to the text to synthesize.
+
+        Returns:
+            Paths of the files that were generated.
+        """
+        missing = {path: text for path, text in prompts.items() if not Path(path).exists()}
+        if not missing:
+            return []
+
+        logger.info("Pre-generating %s missing prompt(s)", len(missing))
+        results = await self.generate_many(missing)
+
+        generated = []
+        for path, result in zip(missing, results):
+            if isinstance(result, BaseException):
+                logger.warning("Could not pre-generate %s: %r", path, result)
+            else:
+                generated.append(result)
+        return generated
+
+    async def generate_audio_stream(self, text: str) -> AsyncIterator[bytes]:
+        """
+        Stream synthesized speech as raw PCM chunks.
+
+        Chunks are yielded as ElevenLabs produces them, so playback can start
+        after the first chunk instead of after the whole file is written.
+        The complete stream is stored in the cache afterwards, and later
+        calls for the same text replay it without an API call.
+
+        Args:
+            text: The text to convert to speech.
+
+        Yields:
+            16 kHz, 16-bit mono PCM audio chunks.
+
+        Example:
+            ```python
+            chunks = tts_service.generate_audio_stream("Passwort?")
+            await mock_ring_service.play_stream("mock-device-123", chunks)
+            ```
+        """
+        cached_file = cache_path(text, self.voice_id, suffix=".pcm")
+        if cached_file.exists():
+            logger.info("Streaming cached audio: %s", cached_file)
+            yield await asyncio.to_thread(cached_file.read_bytes)
+            return
+
+        logger.info("Streaming audio for text: %s", text)
+        chunks = self.client.text_to_speech.stream(
+            voice_id=self.voice_id,
+            text=text,
+            model_id=DEFAULT_MODEL_ID,
+            output_format=STREAM_OUTPUT_FORMAT,
+        )
+
+        # The SDK iterator blocks on the network, so each chunk is pulled in
+        # a worker thread. The request is only sent on the first pull, which
+        # therefore happens while the rate limiter is held.
+        loop = asyncio.get_running_loop()
+        pending = None
+        audio_data = bytearray()
+        try:
+            async with elevenlabs_rate_limiter:
+                pending = loop.run_in_executor(None, next, chunks, None)
+                chunk = await asyncio.shield(pending)
+            while chunk is not None:
+                audio_data.extend(chunk)
+                yield chunk
+                pending = loop.run_in_executor(None, next, chunks, None)
+                chunk = await asyncio.shield(pending)
+        finally:
+            # Release the HTTP response even if playback stops part-way. A
+            # generator can't be closed while a worker is still inside next().
+            if pending is not None and not pending.done():
+                pending.add_done_callback(lambda _: chunks.close())
+            else:
+                chunks.close()
+
+        await asyncio.to_thread(self._write_cache, bytes(audio_data), cached_file)
+
+    def _synthesize(self, text: str) -> bytes:
+        """Call ElevenLabs and collect the streamed audio (blocking)."""
+        audio_generator = self.client.text_to_speech.convert(
+            voice_id=self.voice_id,
+            text=text,
+            model_id=DEFAULT_MODEL_ID,
+        )
+
+        audio_data = bytearray()
+        for chunk in audio_generator:
+            audio_data.extend(chunk)
+        return bytes(audio_data)
+
+    @staticmethod
+    def _write_cache(audio_data: bytes, cached_file: Path) -> None:
+        """
+        Write generated audio to the cache (blocking).
+
+        The entry is written to a temp file and moved into place atomically,
+        so an interrupted write never becomes a cache hit.
+        """
+        cached_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cached_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(audio_data)
+        os.replace(tmp_name, cached_file)
+
+    @classmethod
+    def _store(cls, audio_data: bytes, cached_file: Path, output_file: Path) -> None:
+        """Write generated audio to the cache and the requested path (blocking)."""
+        cls._write_cache(audio_data, cached_file)
+        shutil.copyfile(cached_file, output_file)
+
 
 # Global TTS service instance
 tts_service = TTSService()
@@ -0,0 +1,116 @@
+"""
+Lightweight audio helpers.
+
+A cheap RMS energy gate tells silence from speech in recorded audio, so
+attempts where nobody spoke can skip the STT round-trip. Prompts that are
+always played back to back can be joined into a single file.
+"""
+
+import io
+import math
+import operator
+import os
+import sys
+import tempfile
+import wave
+from array import array
+from typing import Sequence
+
+
+def has_speech(
+    audio: bytes,
+    rms_threshold: float,
+    min_speech_ms: int = 300,
+    frame_ms: int = 30,
+) -> bool:
+    """
+    Check whether recorded audio contains a stretch of speech.
+
+    The audio is split into short frames, and speech is assumed once
+    `min_speech_ms` worth of consecutive frames exceed the RMS threshold.
+    Only 16-bit PCM WAV can be inspected; other formats would need decoding
+    and are treated as containing speech.
+
+    Args:
+        audio: Recorded audio bytes.
+        rms_threshold: Frame RMS (16-bit sample scale) above which a frame
+            counts as speech.
+        min_speech_ms: Minimum length of continuous speech.
+        frame_ms: Analysis frame length in milliseconds.
+
+    Returns:
+        False if the audio is (near) silent, True otherwise.
+    """
+    if not audio.startswith(b"RIFF"):
+        return True
+
+    try:
+        with wave.open(io.BytesIO(audio)) as wav:
+            if wav.getsampwidth() != 2:
+                return True
+            samples_per_frame = wav.getframerate() * wav.getnchannels() * frame_ms // 1000
+            pcm = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return True
+
+    samples = array("h", pcm)
+    if sys.byteorder == "big":
+        samples.byteswap()  # WAV samples are little-endian
+
+    frames_needed = max(1, math.ceil(min_speech_ms / frame_ms))
+    threshold_energy = rms_threshold * rms_threshold * samples_per_frame
+    speech_frames = 0
+    for start in range(0, len(samples) - samples_per_frame + 1, samples_per_frame):
+        frame = samples[start : start + samples_per_frame]
+        # Compare summed energy instead of taking a square root per frame
+        if sum(map(operator.mul, frame, frame)) >= threshold_energy:
+            speech_frames += 1
+            if speech_frames >= frames_needed:
+                return True
+        else:
+            speech_frames = 0
+
+    return False
+
+
+def concat_audio(parts: Sequence[str], output_path: str, gap_ms: int = 500) -> None:
+    """
+    Join audio files into one, with a pause between them (blocking).
+
+    The output is only rebuilt when it is missing or older than one of the
+    parts, so calling this on every startup is cheap. It is exported to a
+    temp file and moved into place, so an interrupted export never leaves a
+    truncated file that looks up to date.
+
+    Args:
+        parts: Paths of the audio files to join, in playback order.
+        output_path: Path of the joined file; its extension sets the format.
+        gap_ms: Silence inserted between consecutive parts.
+
+    Raises:
+        Exception: If a part cannot be decoded (e.g. ffmpeg is missing).
+    """
+    if os.path.exists(output_path):
+        built_at = os.path.getmtime(output_path)
+        if all(os.path.getmtime(part) <= built_at for part in parts):
+            return
+
+    # Imported here: pydub probes for ffmpeg on import
+    from pydub import AudioSegment
+
+    gap = AudioSegment.silent(duration=gap_ms)
+    joined = AudioSegment.from_file(parts[0])
+    for part in parts[1:]:
+        joined += gap + AudioSegment.from_file(part)
+
+    fmt = os.path.splitext(output_path)[1].lstrip(".") or "mp3"
+    fd, tmp_name = tempfile.mkstemp(
+        dir=os.path.dirname(output_path) or ".", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        joined.export(tmp_name, format=fmt)
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
@@ -0,0 +1,42 @@
+"""
+Shared HTTP client factories.
+
+ElevenLabs calls go through httpx; handing the SDK a client configured for
+HTTP/2 and keep-alive lets consecutive requests reuse one TLS connection
+instead of paying a fresh handshake per call.
+"""
+
+import httpx
+
+# Connection pool shared by all ElevenLabs requests of a client
+KEEPALIVE_LIMITS = httpx.Limits(
+    max_keepalive_connections=4,
+    max_connections=10,
+    keepalive_expiry=30,
+)
+
+
+def keepalive_client(timeout: float = 240) -> httpx.Client:
+    """
+    Create a synchronous HTTP/2 client with connection keep-alive.
+
+    Args:
+        timeout: Request timeout in seconds (matches the ElevenLabs SDK default).
+
+    Returns:
+        An httpx.Client suitable for ElevenLabs(httpx_client=...).
+    """
+    return httpx.Client(http2=True, limits=KEEPALIVE_LIMITS, timeout=timeout)
+
+
+def async_keepalive_client(timeout: float = 240) -> httpx.AsyncClient:
+    """
+    Create an asynchronous HTTP/2 client with connection keep-alive.
+
+    Args:
+        timeout: Request timeout in seconds (matches the ElevenLabs SDK default).
+
+    Returns:
+        An httpx.AsyncClient suitable for AsyncElevenLabs(httpx_client=...).
+    """
+    return httpx.AsyncClient(http2=True, limits=KEEPALIVE_LIMITS, timeout=timeout)
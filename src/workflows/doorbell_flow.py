@@ -35,26 +35,51 @@ See Also:
 import asyncio
 import logging
 import time
-from typing import Dict, Optional
+from array import array
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
 from pathlib import Path
+from weakref import WeakValueDictionary
 
 from src.services.mock_ring_service import mock_ring_service
 from src.services.tts_service import tts_service
-from src.services.stt_service import stt_service
+from src.services.stt_service import TranscriptionResult, stt_service
 from src.services.password_service import password_service
+from src.services.tracing_service import flush_langfuse, get_langfuse, should_sample
+from src.utils.audio import concat_audio, has_speech
 from src.config import settings
 
-# Import Langfuse directly
-from langfuse import Langfuse
-
 logger = logging.getLogger(__name__)
 
-# Initialize Langfuse for observability and tracing
-langfuse = Langfuse(
-    public_key=settings.langfuse_public_key,
-    secret_key=settings.langfuse_secret_key,
-    host=settings.langfuse_host,
-)
+# Static witch prompts played during the flow
+GREETING_TEXT = "Passwort?"
+GREETING_AUDIO = "audio_assets/witch_password.mp3"
+WELCOME_AUDIO = "audio_assets/witch_welcome.mp3"
+WRONG_AUDIO = "audio_assets/witch_wrong.mp3"
+REPEAT_AUDIO = "audio_assets/witch_repeat.mp3"
+DENIED_AUDIO = "audio_assets/witch_denied.mp3"
+
+# Filler prompt played while the answer is transcribed
+THINKING_TEXT = "Hmm, mal sehen..."
+THINKING_AUDIO = "audio_assets/witch_thinking.mp3"
+
+# Text of each prompt, used to synthesize files that are missing
+PROMPT_TEXTS = {
+    GREETING_AUDIO: GREETING_TEXT,
+    WELCOME_AUDIO: "Willkommen!",
+    WRONG_AUDIO: "Falsch!",
+    REPEAT_AUDIO: "Wiederholen!",
+    DENIED_AUDIO: "Verweigert!",
+    THINKING_AUDIO: THINKING_TEXT,
+}
+
+PROMPT_AUDIO_FILES = tuple(PROMPT_TEXTS)
+
+# Wrong-password and retry prompts joined into one clip at startup
+WRONG_REPEAT_AUDIO = "audio_assets/witch_wrong_repeat.mp3"
+
+# Transcriptions slower than this get their own Langfuse event
+SLOW_STT_MS = 2000
 
 
 class DoorbellSession:
@@ -70,23 +95,54 @@ class DoorbellSession:
         attempts (int): Number of password attempts made so far.
         max_attempts (int): Maximum number of attempts allowed.
         start_time (float): Unix timestamp when the session started.
-        transcriptions (list[str]): List of all transcriptions received.
-        match_scores (list[float]): List of match scores for each attempt.
+        transcriptions (list[Optional[str]]): Transcription of each attempt,
+            preallocated for max_attempts (None if nothing was transcribed).
+        match_scores (array[float]): Match score of each attempt.
+        stt_latencies_ms (array[float]): STT duration of each attempt.
+        match_latencies_ms (array[float]): Password match duration of each
+            attempt.
+        traced (bool): Whether this session is sampled for Langfuse.
+        pending_events (list[dict]): Langfuse events buffered until the
+            session ends and its trace is ingested.
     """
 
-    def __init__(self, device_id: str):
+    __slots__ = (
+        "device_id",
+        "attempts",
+        "max_attempts",
+        "start_time",
+        "transcriptions",
+        "match_scores",
+        "stt_latencies_ms",
+        "match_latencies_ms",
+        "traced",
+        "pending_events",
+        "_static",
+        "__weakref__",  # Allows tracking in the orchestrator's weak map
+    )
+
+    def __init__(self, device_id: str, max_attempts: Optional[int] = None):
         """
         Initialize a new doorbell session.
 
         Args:
             device_id: The Ring device ID that triggered this session.
+            max_attempts: Maximum number of attempts allowed. Defaults to
+                the configured max_attempts.
         """
         self.device_id = device_id
         self.attempts = 0
-        self.max_attempts = settings.max_attempts
+        self.max_attempts = max_attempts or settings.max_attempts
         self.start_time = time.time()
-        self.transcriptions = []
-        self.match_scores = []
+        # One slot per possible attempt, filled in at index attempts - 1
+        self.transcriptions = [None] * self.max_attempts
+        self.match_scores = array("d", bytes(8 * self.max_attempts))
+        self.stt_latencies_ms = array("d", bytes(8 * self.max_attempts))
+        self.match_latencies_ms = array("d", bytes(8 * self.max_attempts))
+        self.traced = False
+        self.pending_events = []
+        # Fields of to_dict() that never change during the session
+        self._static = {"device_id": device_id, "max_attempts": self.max_attempts}
 
     def to_dict(self) -> dict:
         """
@@ -98,16 +154,16 @@ class DoorbellSession:
                 - attempts: Number of attempts made
                 - max_attempts: Maximum attempts allowed
                 - duration_seconds: Total session duration
-                - transcriptions: List of all transcriptions
-                - match_scores: List of all match scores
+                - transcriptions: Transcription of each attempt made
+                - match_scores: Match score of each attempt made
         """
+        attempts = self.attempts
         return {
-            "device_id": self.device_id,
-            "attempts": self.attempts,
-            "max_attempts": self.max_attempts,
+            **self._static,
+            "attempts": attempts,
             "duration_seconds": round(time.time() - self.start_time, 2),
-            "transcriptions": self.transcriptions,
-            "match_scores": self.match_scores,
+            "transcriptions": self.transcriptions[:attempts],
+            "match_scores": self.match_scores[:attempts].tolist(),
         }
 
 
@@ -121,14 +177,85 @@ class DoorbellFlowOrchestrator:
     press to access grant/denial.
     
     Attributes:
-        active_sessions (Dict[str, DoorbellSession]): Dictionary mapping device
-            IDs to their active sessions. Used to track multiple concurrent
-            doorbell interactions.
+        active_sessions (WeakValueDictionary[str, DoorbellSession]): Mapping
+            of device IDs to their active sessions. Used to track multiple
+            concurrent doorbell interactions. Entries disappear on their own
+            once the handling coroutine releases its session.
     """
 
     def __init__(self):
-        """Initialize the orchestrator with an empty session dictionary."""
-        self.active_sessions: Dict[str, DoorbellSession] = {}
+        """Initialize the orchestrator with an empty session mapping."""
+        self.active_sessions: "WeakValueDictionary[str, DoorbellSession]" = (
+            WeakValueDictionary()
+        )
+        # Settings used on every event, read once instead of per attempt
+        self._max_attempts = settings.max_attempts
+        self._recording_duration = settings.recording_duration
+        self._vad_rms_threshold = settings.vad_rms_threshold
+        self._langfuse_enforce_flush = settings.langfuse_enforce_flush
+        self._langfuse_sample_rate = settings.langfuse_sample_rate
+        self._langfuse_anomalies_only = settings.langfuse_anomalies_only
+        # Strong references to fire-and-forget tasks until they finish
+        self._background_tasks: set[asyncio.Task] = set()
+        # Set by prepare_assets()/warmup() once WRONG_REPEAT_AUDIO is available
+        self._wrong_repeat_ready = False
+
+    async def prepare_assets(self) -> None:
+        """
+        Generate missing prompt audio files and join the retry prompts.
+
+        Runs as part of warmup() unless PREPARE_ASSETS_ON_STARTUP is off.
+        When the server starts several workers, it is run once beforehand
+        instead, so the workers don't each pay for the same syntheses or
+        race on the joined file.
+        """
+        await tts_service.warm_cache(PROMPT_TEXTS)
+
+        try:
+            await asyncio.to_thread(
+                concat_audio, (WRONG_AUDIO, REPEAT_AUDIO), WRONG_REPEAT_AUDIO
+            )
+            self._wrong_repeat_ready = True
+        except Exception as e:
+            logger.warning("Could not join retry prompts, playing them separately: %s", e)
+
+    async def warmup(self) -> None:
+        """
+        Prepare the orchestrator before the first doorbell event.
+
+        Called once at application startup so the first real doorbell press
+        does not pay for service initialization or speech synthesis.
+        Prepares the prompt audio (see prepare_assets) and logs prompts
+        that are still missing.
+        """
+        if settings.prepare_assets_on_startup:
+            await self.prepare_assets()
+        else:
+            self._wrong_repeat_ready = Path(WRONG_REPEAT_AUDIO).exists()
+
+        missing = [path for path in PROMPT_AUDIO_FILES if not Path(path).exists()]
+        for path in missing:
+            logger.warning("Prompt audio file not found: %s", path)
+
+        logger.info(
+            "Doorbell orchestrator warmed up (%s/%s prompts available)",
+            len(PROMPT_AUDIO_FILES) - len(missing),
+            len(PROMPT_AUDIO_FILES),
+        )
+
+    async def shutdown(self) -> None:
+        """
+        Release resources held by the workflow services.
+
+        Called once at application shutdown. Lets playbacks that are still
+        running finish, sends queued trace events, then closes pooled HTTP
+        connections.
+        """
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await asyncio.to_thread(flush_langfuse)
+        await stt_service.aclose()
+        tts_service.close()
+        logger.info("Doorbell orchestrator shut down")
 
     async def handle_doorbell_event(self, device_id: str) -> dict:
         """
@@ -181,14 +308,14 @@ class DoorbellFlowOrchestrator:
             - Password match scores
             - Authentication success/failure
         """
-        logger.info(f"🔔 Doorbell event started for device: {device_id}")
-
-        # TODO: Add Langfuse tracing once API documentation is verified
-        # The Langfuse Python SDK API has changed between versions
-        # Need to verify correct method signatures for trace/span/score
+        logger.info("🔔 Doorbell event started for device: %s", device_id)
 
-        session = DoorbellSession(device_id)
+        session = DoorbellSession(device_id, self._max_attempts)
         self.active_sessions[device_id] = session
+        # Sampling is decided up front so unsampled events skip all tracing
+        session.traced = should_sample(
+            f"{device_id}:{session.start_time}", self._langfuse_sample_rate
+        )
 
         try:
             # Step 1: Play "Passwort?" greeting
@@ -197,43 +324,40 @@ class DoorbellFlowOrchestrator:
             # Step 2-4: Attempt password authentication (with retries)
             while session.attempts < session.max_attempts:
                 session.attempts += 1
-                logger.info(f"🔄 Attempt {session.attempts}/{session.max_attempts}")
+                logger.info("🔄 Attempt %s/%s", session.attempts, session.max_attempts)
 
                 # Record audio response
-                audio_path = await self._record_response(device_id)
-                if not audio_path:
+                audio = await self._record_response(device_id)
+                if not audio:
                     await self._play_no_audio_message(device_id)
                     continue
 
-                # Transcribe audio (with tracing)
-                start_time = time.time()
-                transcription = await self._transcribe_audio(audio_path)
-                stt_latency = time.time() - start_time
-                session.transcriptions.append(transcription["text"])
-
-                # TODO: Log STT latency to Langfuse
-                logger.debug(f"STT latency: {stt_latency:.3f}s")
-
-                # Check password (with tracing)
-                start_time = time.time()
-                match, score, matched_password = self._check_password(
-                    transcription["text"]
+                # Transcribe audio
+                transcription = await self._transcribe_while_thinking(
+                    device_id, audio
                 )
-                match_latency = time.time() - start_time
-                session.match_scores.append(score)
-
-                # TODO: Log password match to Langfuse
-                logger.debug(f"Password match latency: {match_latency:.3f}s")
+                slot = session.attempts - 1
+                session.transcriptions[slot] = transcription.text
+                session.stt_latencies_ms[slot] = transcription.duration_ms
+                logger.debug("STT latency: %.0fms", transcription.duration_ms)
+
+                # Check password
+                start_ns = time.perf_counter_ns()
+                match, score, matched_password = await self._check_password(
+                    transcription.text
+                )
+                match_latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                session.match_scores[slot] = score
+                session.match_latencies_ms[slot] = match_latency_ms
+                logger.debug("Password match latency: %.3fms", match_latency_ms)
+                self._record_attempt(session, match)
 
                 if match:
                     # SUCCESS!
                     result = await self._handle_success(
                         device_id, session, matched_password, score
                     )
-
-                    # TODO: Log success to Langfuse
-                    logger.info(f"Authentication success logged (Langfuse integration pending)")
-
+                    self._record_trace(session, result)
                     return result
                 else:
                     # Wrong password
@@ -241,14 +365,11 @@ class DoorbellFlowOrchestrator:
 
             # Max attempts reached - DENIED
             result = await self._handle_access_denied(device_id, session)
-
-            # TODO: Log denial to Langfuse
-            logger.info(f"Authentication denial logged (Langfuse integration pending)")
-
+            self._record_trace(session, result)
             return result
 
         except Exception as e:
-            logger.error(f"❌ Error in doorbell flow: {e}")
+            logger.error("❌ Error in doorbell flow: %s", e)
             await self._play_error_message(device_id)
 
             error_result = {
@@ -256,66 +377,227 @@ class DoorbellFlowOrchestrator:
                 "error": str(e),
                 "session": session.to_dict(),
             }
+            self._record_trace(session, error_result)
+            return error_result
 
-            # TODO: Log error to Langfuse
-            logger.error(f"Authentication error logged (Langfuse integration pending)")
+    def _record_trace(self, session: DoorbellSession, result: dict) -> None:
+        """
+        Ingest the trace of a finished event into Langfuse.
 
-            return error_result
+        Nothing is sent while the flow runs: attempt events are buffered
+        on the session and ingested here together with the outcome and
+        per-attempt latencies, in one worker-thread call that the caller
+        does not wait for. With LANGFUSE_ANOMALIES_ONLY, a success without
+        notable attempts is discarded instead.
 
-        finally:
-            # Cleanup session
-            if device_id in self.active_sessions:
-                del self.active_sessions[device_id]
+        Args:
+            session: The finished doorbell session.
+            result: The result dictionary returned to the caller.
+        """
+        if not session.traced:
+            return
+        if (
+            self._langfuse_anomalies_only
+            and result["status"] == "success"
+            and not session.pending_events
+        ):
+            return
+
+        self._run_in_background(asyncio.to_thread(self._ingest_trace, session, result))
+
+    def _ingest_trace(self, session: DoorbellSession, result: dict) -> None:
+        """
+        Create the Langfuse trace with its buffered events (blocking).
+
+        Args:
+            session: The finished doorbell session.
+            result: The result dictionary returned to the caller.
+        """
+        try:
+            trace = get_langfuse().trace(
+                name="doorbell_event",
+                timestamp=datetime.fromtimestamp(session.start_time, timezone.utc),
+                input={"device_id": session.device_id},
+                output=result,
+                metadata={
+                    "status": result["status"],
+                    "attempts": session.attempts,
+                    "stt_latencies_ms": session.stt_latencies_ms[
+                        : session.attempts
+                    ].tolist(),
+                    "match_latencies_ms": session.match_latencies_ms[
+                        : session.attempts
+                    ].tolist(),
+                },
+            )
+            for event in session.pending_events:
+                trace.event(**event)
+
+            # The SDK normally ships events in background batches
+            if self._langfuse_enforce_flush:
+                flush_langfuse()
+        except Exception as e:
+            logger.warning("Failed to record Langfuse trace: %s", e)
+
+    @staticmethod
+    def _record_attempt(session: DoorbellSession, match: bool) -> None:
+        """
+        Buffer a Langfuse event for an attempt worth inspecting on its own.
+
+        Only failed, slow or final attempts get an event. Routine attempts
+        are still covered by the per-attempt lists in the trace, so a quick
+        first-try success adds no extra observation.
+
+        Args:
+            session: The doorbell session, with the attempt just recorded.
+            match: Whether the attempt matched a password.
+        """
+        if not session.traced:
+            return
+
+        slot = session.attempts - 1
+        stt_latency_ms = session.stt_latencies_ms[slot]
+        if (
+            match
+            and stt_latency_ms < SLOW_STT_MS
+            and session.attempts < session.max_attempts
+        ):
+            return
+
+        session.pending_events.append(
+            {
+                "name": "authentication_attempt",
+                "start_time": datetime.now(timezone.utc),
+                "level": "DEFAULT" if match else "WARNING",
+                "metadata": {
+                    "attempt": session.attempts,
+                    "transcription": session.transcriptions[slot],
+                    "score": session.match_scores[slot],
+                    "stt_latency_ms": stt_latency_ms,
+                    "match_latency_ms": session.match_latencies_ms[slot],
+                },
+            }
+        )
 
     async def _play_greeting(self, device_id: str) -> None:
         """
         Play the initial 'Passwort?' greeting to the visitor.
 
+        Falls back to streaming the greeting from TTS when the prompt file
+        has not been generated. A failing stream is logged and does not
+        abort the doorbell event.
+
         Args:
             device_id: The Ring device ID to play audio on.
         """
         logger.info("🎭 Playing greeting: 'Passwort?'")
-        audio_path = "audio_assets/witch_password.mp3"
-        await mock_ring_service.play_audio(device_id, audio_path)
-        await asyncio.sleep(0.5)  # Wait a bit after playing
+        if Path(GREETING_AUDIO).exists():
+            await mock_ring_service.play_audio(device_id, GREETING_AUDIO)
+            return
+
+        # No pre-generated file yet: play the synthesis as it streams in
+        stream = tts_service.generate_audio_stream(GREETING_TEXT)
+        played_chunks = 0
+
+        async def counted() -> AsyncIterator[bytes]:
+            nonlocal played_chunks
+            async for chunk in stream:
+                played_chunks += 1
+                yield chunk
+
+        try:
+            await mock_ring_service.play_stream(device_id, counted())
+        except Exception as e:
+            logger.warning("Streaming greeting failed: %s", e)
+            if not played_chunks:
+                # Nothing played yet; let the file path log the missing prompt
+                await mock_ring_service.play_audio(device_id, GREETING_AUDIO)
+        finally:
+            # Releases the TTS response if playback stopped part-way
+            await stream.aclose()
 
-    async def _record_response(self, device_id: str) -> Optional[str]:
+    async def _record_response(self, device_id: str) -> Optional[bytes]:
         """
         Record the visitor's audio response after the greeting.
 
+        The audio stays in memory and goes straight to STT, without a
+        temporary file in between. Silent recordings are discarded here so
+        they never reach the STT service.
+
         Args:
             device_id: The Ring device ID to record from.
 
         Returns:
-            Path to the recorded audio file, or None if recording failed.
+            The recorded audio, or None if recording failed or nobody spoke.
         """
         logger.info("🎤 Recording response...")
-        duration = settings.recording_duration
-        audio_path = await mock_ring_service.record_audio(device_id, duration)
-        return audio_path
+        duration = self._recording_duration
+        audio = await mock_ring_service.record_audio_stream(device_id, duration)
+
+        if audio and not await asyncio.to_thread(
+            has_speech, audio, self._vad_rms_threshold
+        ):
+            logger.info("   No speech detected in recording")
+            return None
+        return audio
 
-    async def _transcribe_audio(self, audio_path: str) -> dict:
+    async def _transcribe_audio(self, audio: bytes) -> TranscriptionResult:
         """
         Transcribe the recorded audio to text using STT service.
 
         Args:
-            audio_path: Path to the audio file to transcribe.
+            audio: The recorded audio to transcribe.
 
         Returns:
-            Dictionary containing transcription results with 'text' key.
+            TranscriptionResult with the transcribed text.
 
         Raises:
             Exception: If transcription fails.
         """
         logger.info("📝 Transcribing audio...")
-        transcription = await stt_service.transcribe(audio_path)
-        logger.info(f"   Transcribed: '{transcription['text']}'")
+        transcription = await stt_service.transcribe_bytes(audio)
+        logger.info("   Transcribed: '%s'", transcription.text)
+        return transcription
+
+    async def _transcribe_while_thinking(
+        self, device_id: str, audio: bytes
+    ) -> TranscriptionResult:
+        """
+        Transcribe the recorded audio while the witch plays a filler prompt.
+
+        The STT round-trip is the slowest step of an attempt, so the optional
+        "thinking" prompt is played concurrently instead of leaving the
+        visitor in silence. Without the prompt file this is a plain
+        transcription.
+
+        Args:
+            device_id: The Ring device ID to play audio on.
+            audio: The recorded audio to transcribe.
+
+        Returns:
+            TranscriptionResult with the transcribed text.
+
+        Raises:
+            Exception: If transcription fails.
+        """
+        if not Path(THINKING_AUDIO).exists():
+            return await self._transcribe_audio(audio)
+
+        transcription, _ = await asyncio.gather(
+            self._transcribe_audio(audio),
+            mock_ring_service.play_audio(device_id, THINKING_AUDIO),
+        )
         return transcription
 
-    def _check_password(self, text: str) -> tuple[bool, float, Optional[str]]:
+    async def _check_password(
+        self, text: str
+    ) -> tuple[bool, float, Optional[str]]:
         """
         Check if transcribed text matches any configured password.
 
+        Matching runs in a worker thread so concurrent doorbell events are
+        not held up by the fuzzy and phonetic scoring.
+
         Args:
             text: The transcribed text to check.
 
@@ -325,9 +607,11 @@ class DoorbellFlowOrchestrator:
             - similarity_score: Confidence score (0-100)
             - matched_password: The password that matched, or None
         """
-        logger.info(f"🔍 Checking password: '{text}'")
-        match, score, password = password_service.check_password(text)
-        logger.info(f"   Match: {match}, Score: {score:.2f}%")
+        logger.info("🔍 Checking password: '%s'", text)
+        match, score, password = await asyncio.to_thread(
+            password_service.check_password, text
+        )
+        logger.info("   Match: %s, Score: %.2f%%", match, score)
         return match, score, password
 
     async def _handle_success(
@@ -336,7 +620,8 @@ class DoorbellFlowOrchestrator:
         """
         Handle successful password match and grant access.
 
-        Plays the welcome message and returns a success result dictionary.
+        Starts the welcome message and returns a success result dictionary
+        without waiting for playback to finish.
 
         Args:
             device_id: The Ring device ID.
@@ -347,10 +632,12 @@ class DoorbellFlowOrchestrator:
         Returns:
             Dictionary with status "success" and relevant details.
         """
-        logger.info(f"✅ SUCCESS! Password '{password}' matched with {score:.2f}% confidence")
+        logger.info(
+            "✅ SUCCESS! Password '%s' matched with %.2f%% confidence", password, score
+        )
 
-        # Play welcome message
-        await mock_ring_service.play_audio(device_id, "audio_assets/witch_welcome.mp3")
+        # Play welcome message; access is already decided
+        self._play_in_background(device_id, WELCOME_AUDIO)
 
         result = {
             "status": "success",
@@ -360,35 +647,55 @@ class DoorbellFlowOrchestrator:
             "session": session.to_dict(),
         }
 
-        logger.info(f"✅ Access granted after {session.attempts} attempt(s)")
+        logger.info("✅ Access granted after %s attempt(s)", session.attempts)
         return result
 
-    async def _handle_wrong_password(self, device_id: str, session: DoorbellSession) -> None:
+    async def _handle_wrong_password(
+        self, device_id: str, session: DoorbellSession
+    ) -> None:
         """
         Handle wrong password attempt with appropriate feedback.
 
-        Plays error messages and prompts for retry if attempts remain.
+        Plays the error and retry prompts if attempts remain. Playback has
+        to finish before the next recording, so the visitor never answers
+        over the witch.
 
         Args:
             device_id: The Ring device ID.
             session: The current doorbell session.
         """
-        logger.warning(f"❌ Wrong password (attempt {session.attempts}/{session.max_attempts})")
+        logger.warning(
+            "❌ Wrong password (attempt %s/%s)", session.attempts, session.max_attempts
+        )
 
         if session.attempts < session.max_attempts:
             # Not last attempt - ask to try again
-            await mock_ring_service.play_audio(device_id, "audio_assets/witch_wrong.mp3")
-            await asyncio.sleep(0.5)
-            await mock_ring_service.play_audio(device_id, "audio_assets/witch_repeat.mp3")
-        else:
-            # Last attempt failed - will be denied
-            pass
+            await self._play_wrong_and_repeat(device_id)
+
+    async def _play_wrong_and_repeat(self, device_id: str) -> None:
+        """
+        Play the wrong-password message followed by the retry prompt.
+
+        Uses the joined clip built at startup when available, so the pause
+        between the two is part of the audio instead of a separate sleep.
+
+        Args:
+            device_id: The Ring device ID to play audio on.
+        """
+        if self._wrong_repeat_ready:
+            await mock_ring_service.play_audio(device_id, WRONG_REPEAT_AUDIO)
+            return
+
+        await mock_ring_service.play_audio(device_id, WRONG_AUDIO)
+        await asyncio.sleep(0.5)
+        await mock_ring_service.play_audio(device_id, REPEAT_AUDIO)
 
     async def _handle_access_denied(self, device_id: str, session: DoorbellSession) -> dict:
         """
         Handle access denied after maximum attempts exceeded.
 
-        Plays denial message and returns denial result dictionary.
+        Starts the denial message and returns a denial result dictionary
+        without waiting for playback to finish.
 
         Args:
             device_id: The Ring device ID.
@@ -397,10 +704,10 @@ class DoorbellFlowOrchestrator:
         Returns:
             Dictionary with status "denied" and relevant details.
         """
-        logger.error(f"🚫 ACCESS DENIED after {session.attempts} attempts")
+        logger.error("🚫 ACCESS DENIED after %s attempts", session.attempts)
 
         # Play access denied message
-        await mock_ring_service.play_audio(device_id, "audio_assets/witch_denied.mp3")
+        self._play_in_background(device_id, DENIED_AUDIO)
 
         result = {
             "status": "denied",
@@ -411,6 +718,34 @@ class DoorbellFlowOrchestrator:
 
         return result
 
+    def _play_in_background(self, device_id: str, audio_file_path: str) -> None:
+        """
+        Start playing an audio file without waiting for it to finish.
+
+        Used once the outcome of an event is decided, so callers get the
+        result without waiting for the closing message.
+
+        Args:
+            device_id: The Ring device ID to play audio on.
+            audio_file_path: Path to the audio file to play.
+        """
+        self._run_in_background(
+            mock_ring_service.play_audio(device_id, audio_file_path)
+        )
+
+    def _run_in_background(self, coro) -> None:
+        """
+        Run a coroutine as a task the event handler does not wait for.
+
+        The task is referenced until it finishes and awaited on shutdown.
+
+        Args:
+            coro: The coroutine to run.
+        """
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def _play_no_audio_message(self, device_id: str) -> None:
         """
         Play message when no audio was detected in the recording.
@@ -419,7 +754,7 @@ class DoorbellFlowOrchestrator:
             device_id: The Ring device ID to play audio on.
         """
         logger.warning("⚠️  No audio detected")
-        await mock_ring_service.play_audio(device_id, "audio_assets/witch_repeat.mp3")
+        await mock_ring_service.play_audio(device_id, REPEAT_AUDIO)
 
     async def _play_error_message(self, device_id: str) -> None:
         """
@@ -430,7 +765,7 @@ class DoorbellFlowOrchestrator:
         """
         logger.error("⚠️  System error")
         # We don't have witch_error.mp3 with content, so use witch_denied
-        await mock_ring_service.play_audio(device_id, "audio_assets/witch_denied.mp3")
+        await mock_ring_service.play_audio(device_id, DENIED_AUDIO)
 
 
 # Global orchestrator instance
@@ -4,9 +4,18 @@ Tests all components and the full doorbell workflow.
 """
 
 import asyncio
-import requests
+import os
 import json
-from pathlib import Path
+
+import httpx
+
+# One pooled keep-alive client for all requests against the local API. Each
+# check prints its section only once its responses are in, so checks running
+# concurrently don't interleave their output.
+CLIENT = httpx.AsyncClient(
+    base_url="http://localhost:8000",
+    limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+)
 
 
 def print_section(title: str):
@@ -16,12 +25,11 @@ def print_section(title: str):
     print(f"{'='*60}\n")
 
 
-def test_api_health():
+async def test_api_health():
     """Test if API is running."""
-    print_section("🏥 Testing API Health")
-
     try:
-        response = requests.get("http://localhost:8000/health", timeout=5)
+        response = await CLIENT.get("/health", timeout=5)
+        print_section("🏥 Testing API Health")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ API is healthy!")
@@ -32,16 +40,15 @@ def test_api_health():
             print(f"❌ API returned status code: {response.status_code}")
             return False
     except Exception as e:
+        print_section("🏥 Testing API Health")
         print(f"❌ API is not running: {e}")
         print("\n💡 Start the API with:")
         print("   python src/main.py")
         return False
 
 
-def test_password_matching():
+async def test_password_matching():
     """Test password matching endpoint."""
-    print_section("🔐 Testing Password Matching")
-
     test_cases = [
         ("alohomora", True, "Exact match"),
         ("alo mora", True, "Fuzzy match with space"),
@@ -51,12 +58,45 @@ def test_password_matching():
 
     all_passed = True
 
-    for text, should_match, description in test_cases:
+    # The requests are independent, so they are sent concurrently. The first
+    # failing case cancels the ones still in flight; results are still
+    # reported in test case order.
+    tasks = [
+        asyncio.create_task(
+            CLIENT.post("/test/password", params={"text": text}, timeout=5)
+        )
+        for text, _, _ in test_cases
+    ]
+    expected = {
+        task: should_match for task, (_, should_match, _) in zip(tasks, test_cases)
+    }
+
+    def case_passed(task: asyncio.Task) -> bool:
+        if task.exception() is not None or task.result().status_code != 200:
+            return False
+        return task.result().json()["match"] == expected[task]
+
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(
+            pending, return_when=asyncio.FIRST_COMPLETED
+        )
+        if not all(case_passed(task) for task in done):
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            break
+
+    print_section("🔐 Testing Password Matching")
+
+    for (text, should_match, description), task in zip(test_cases, tasks):
+        if task.cancelled():
+            print(f"⏭️  '{text}' - skipped after an earlier failure")
+            all_passed = False
+            continue
+
         try:
-            response = requests.post(
-                f"http://localhost:8000/test/password?text={text}",
-                timeout=5
-            )
+            response = task.result()
 
             if response.status_code == 200:
                 data = response.json()
@@ -82,7 +122,7 @@ def test_password_matching():
     return all_passed
 
 
-def test_audio_files():
+async def test_audio_files():
     """Check if audio files exist."""
     print_section("🎵 Checking Audio Files")
 
@@ -94,13 +134,18 @@ def test_audio_files():
         "witch_repeat.mp3",
     ]
 
-    audio_dir = Path("audio_assets")
+    # One directory read; DirEntry carries the stat info on most platforms
+    try:
+        with os.scandir("audio_assets") as it:
+            entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        entries = {}
     all_exist = True
 
     for filename in required_files:
-        filepath = audio_dir / filename
-        if filepath.exists():
-            size = filepath.stat().st_size / 1024
+        entry = entries.get(filename)
+        if entry is not None:
+            size = entry.stat().st_size / 1024
             if size > 0:
                 print(f"✅ {filename} ({size:.1f} KB)")
             else:
@@ -113,18 +158,13 @@ def test_audio_files():
     return all_exist
 
 
-def test_complete_workflow():
+async def test_complete_workflow():
     """Test the complete doorbell workflow."""
-    print_section("🚪 Testing Complete Doorbell Workflow")
-
-    print("Starting complete workflow test...")
-    print("This simulates a full doorbell event:\n")
-
     try:
-        response = requests.post(
-            "http://localhost:8000/test/complete-flow",
-            timeout=30
-        )
+        response = await CLIENT.post("/test/complete-flow", timeout=30)
+
+        print_section("🚪 Testing Complete Doorbell Workflow")
+        print("This simulated a full doorbell event:\n")
 
         if response.status_code == 200:
             data = response.json()
@@ -152,20 +192,17 @@ def test_complete_workflow():
             return False
 
     except Exception as e:
+        print_section("🚪 Testing Complete Doorbell Workflow")
         print(f"❌ Error testing workflow: {e}")
         return False
 
 
-def test_webhook_endpoint():
+async def test_webhook_endpoint():
     """Test the webhook endpoint."""
-    print_section("🔗 Testing Webhook Endpoint")
-
     try:
-        response = requests.post(
-            "http://localhost:8000/webhooks/ring/doorbell",
-            timeout=30
-        )
+        response = await CLIENT.post("/webhooks/ring/doorbell", timeout=30)
 
+        print_section("🔗 Testing Webhook Endpoint")
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Webhook endpoint working!")
@@ -177,11 +214,12 @@ def test_webhook_endpoint():
             return False
 
     except Exception as e:
+        print_section("🔗 Testing Webhook Endpoint")
         print(f"❌ Error testing webhook: {e}")
         return False
 
 
-def run_all_tests():
+async def run_all_tests():
     """Run all system tests."""
     print("\n" + "="*60)
     print("  🧙‍♀️ Ring Ring Who's There - System Test")
@@ -189,24 +227,28 @@ def run_all_tests():
 
     results = {}
 
-    # Test 1: API Health
-    results["API Health"] = test_api_health()
-
-    if not results["API Health"]:
-        print("\n❌ Cannot continue tests - API is not running!")
-        return
-
-    # Test 2: Password Matching
-    results["Password Matching"] = test_password_matching()
-
-    # Test 3: Audio Files
-    results["Audio Files"] = test_audio_files()
+    try:
+        # Tests 1-4 are independent and run concurrently
+        (
+            results["API Health"],
+            results["Password Matching"],
+            results["Audio Files"],
+            results["Webhook Endpoint"],
+        ) = await asyncio.gather(
+            test_api_health(),
+            test_password_matching(),
+            test_audio_files(),
+            test_webhook_endpoint(),
+        )
 
-    # Test 4: Complete Workflow
-    results["Complete Workflow"] = test_complete_workflow()
+        if not results["API Health"]:
+            print("\n❌ Cannot continue tests - API is not running!")
+            return
 
-    # Test 5: Webhook Endpoint
-    results["Webhook Endpoint"] = test_webhook_endpoint()
+        # Test 5: Complete Workflow
+        results["Complete Workflow"] = await test_complete_workflow()
+    finally:
+        await CLIENT.aclose()
 
     # Summary
     print_section("📊 Test Summary")
@@ -230,4 +272,4 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    run_all_tests()
+    asyncio.run(run_all_tests())
@@ -5,14 +5,17 @@ Tests with a known voice ID.
 
 import asyncio
 from pathlib import Path
-from elevenlabs.client import ElevenLabs
 from src.config import settings
+from src.services.tts_service import TTSService, cache_path
 
 
 async def test_voice(voice_id: str = None, text: str = "Passwort?"):
-    """Test audio generation with a specific voice."""
+    """
+    Test audio generation with a specific voice.
 
-    client = ElevenLabs(api_key=settings.elevenlabs_api_key)
+    Audio goes through the shared content-addressed TTS cache, so re-running
+    with the same voice and text does not call the API again.
+    """
 
     # If no voice_id provided, try a common one
     if not voice_id:
@@ -22,22 +25,14 @@ async def test_voice(voice_id: str = None, text: str = "Passwort?"):
     print(f"   Voice ID: {voice_id}")
     print(f"   Text: {text}\n")
 
+    tts = TTSService(voice_id=voice_id)
     try:
-        # Generate audio
-        audio_generator = client.text_to_speech.convert(
-            voice_id=voice_id,
-            text=text,
-            model_id="eleven_multilingual_v2",
-        )
-
-        # Save to file
-        output_path = Path("audio_assets/test_voice.mp3")
-        output_path.parent.mkdir(exist_ok=True)
+        if cache_path(text, voice_id).exists():
+            print("♻️  Using cached audio (no API call)")
 
-        with open(output_path, "wb") as f:
-            for chunk in audio_generator:
-                if chunk:
-                    f.write(chunk)
+        # Generate audio (rate-limited, served from the cache on a hit)
+        output_path = Path("audio_assets/test_voice.mp3")
+        await tts.generate_audio(text, str(output_path))
 
         file_size = output_path.stat().st_size / 1024
         print(f"✅ Success! Audio generated:")
@@ -59,6 +54,9 @@ async def test_voice(voice_id: str = None, text: str = "Passwort?"):
 
         return None
 
+    finally:
+        tts.close()
+
 
 if __name__ == "__main__":
     asyncio.run(test_voice())